@@ -1,17 +1,42 @@
 #!/usr/bin/python3
 
 import argparse
+import asyncio
+import hashlib
 import subprocess
 import json
 import os
 import platform
+import re
+import shutil
+import sys
+import time
 
 from datetime import datetime, timedelta
-from glob import glob
+from functools import lru_cache
+
+# Only the end of a log is read when checking progress; ffmpeg's status line is far shorter than this.
+LOG_TAIL_BYTES = 8192
+
+# Matches the HH:MM:SS(.ss) value of time= in an ffmpeg progress line.
+PROGRESS_TIME_RE = re.compile(rb"-?\d+:\d{2}:\d{2}(\.\d+)?")
+
+# How often -watch polls the chapter logs for new output.
+WATCH_INTERVAL_SECONDS = 5
+
+# ffprobe output is cached here, keyed by input path, mtime, size and probe command.
+FFPROBE_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "ffchapter")
+
+# The script never changes directory, so the working directory is resolved once.
+CWD = os.getcwd()
 
 # ---Helper functions---
+@lru_cache(maxsize=None)
 def get_abs_path(relative_path):
-    return os.path.join(os.getcwd(), relative_path)
+    return os.path.join(CWD, relative_path)
+
+TMP_DIR = get_abs_path("tmp")
+LOG_DIR = get_abs_path("log")
 
 def ensure_directories_exist(input_file):
     """Ensures that the required directories exist and creates them if not."""
@@ -25,6 +50,19 @@ def ensure_directories_exist(input_file):
         os.makedirs(abs_dir_path, exist_ok=True)
         print(f"[INFO] '{abs_dir_path}' directory is ready.")
 
+def get_svt_lp(svt_av1_params):
+    """Returns the SVT-AV1 'lp' (level of parallelism) setting, defaulting to 1."""
+    lp = 1
+    for param in svt_av1_params.strip().split(":"):
+        key, _, value = param.partition("=")
+        if key.strip() == "lp" and value.strip().isdigit():
+            lp = max(1, int(value))
+    return lp
+
+def get_encode_workers(svt_av1_params):
+    """Returns how many chapter encodes can run at once given the SVT-AV1 'lp' setting."""
+    return max(1, (os.cpu_count() or 1) // get_svt_lp(svt_av1_params))
+
 def user_confirmation():
     """Prompts user for confirmation to proceed with cleanup."""
     user_input = input("Proceed with cleanup? (yes/no): ").lower()
@@ -35,20 +73,26 @@ def user_confirmation():
 def cleanup_directories():
     for folder in ["log", "tmp", "__pycache__"]:
         abs_folder_path = get_abs_path(folder)
-        for root, dirs, files in os.walk(abs_folder_path, topdown=False):
-            for name in files:
-                os.remove(os.path.join(root, name))
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
+        shutil.rmtree(abs_folder_path, ignore_errors=True)
         print(f"[INFO] Cleaned up '{abs_folder_path}' folder.")
     ffjob_json_path = get_abs_path("ffjob.json")
-    if os.path.exists(ffjob_json_path):
+    try:
         os.remove(ffjob_json_path)
         print(f"[INFO] '{ffjob_json_path}' file removed.")
+    except FileNotFoundError:
+        pass
+
+def list_chapter_files():
+    """Returns the sorted absolute paths of the encoded chapter files in the tmp folder."""
+    try:
+        with os.scandir(TMP_DIR) as entries:
+            return sorted(e.path for e in entries if e.is_file(follow_symlinks=False) and e.name.endswith(".mkv"))
+    except FileNotFoundError:
+        return []
 
 def verify_files():
     """Verify that all chapter files exist in the tmp folder."""
-    chapter_files = glob("tmp/*.mkv")
+    chapter_files = list_chapter_files()
     if not chapter_files:
         print("[ERROR] No chapter files found in 'tmp' directory.")
         exit(1)
@@ -59,19 +103,21 @@ def run_vmaf(original_file, encoded_file):
     """Runs VMAF test on the first 1 minute of the original and encoded files."""
     try:
         print("[INFO] Running VMAF test on the first 1 minute of video...")
+        # Limit both inputs to the sampled minute so neither is demuxed past it, and let libvmaf use every core.
         vmaf_command = [
             "ffmpeg",
+            "-t", "60",
             "-i", encoded_file,
-            "-i", original_file,
-            "-filter_complex", "[0:v]setpts=PTS-STARTPTS[reference];[1:v]setpts=PTS-STARTPTS[distorted];[distorted][reference]libvmaf=model_path=/usr/local/share/model/vmaf_v0.6.1.json:log_path=vmaf_log.json:log_fmt=json",
             "-t", "60",
+            "-i", original_file,
+            "-filter_complex", f"[0:v]setpts=PTS-STARTPTS[reference];[1:v]setpts=PTS-STARTPTS[distorted];[distorted][reference]libvmaf=model_path=/usr/local/share/model/vmaf_v0.6.1.json:log_path=vmaf_log.json:log_fmt=json:n_threads={os.cpu_count() or 1}",
             "-f", "null",
             "-"
         ]
         result = subprocess.run(vmaf_command, capture_output=True, text=True)
         if result.returncode != 0:
             raise Exception(f"VMAF test error: {result.stderr}")
-        with open("vmaf_log.json", 'r') as log_file:
+        with open("vmaf_log.json", 'rb') as log_file:
             vmaf_results = json.load(log_file)
         vmaf_score = vmaf_results['VMAF_score']
         print(f"[INFO] VMAF score for the first 1 minute: {vmaf_score}")
@@ -83,14 +129,13 @@ def run_vmaf(original_file, encoded_file):
 def concatenate_chapters():
     try:
         print("[INFO] Concatenating chapter files...")
-        tmp_dir = get_abs_path("tmp")
-        chapter_files = sorted(glob(os.path.join(tmp_dir, "*.mkv")))
-        concat_file_path = os.path.join(tmp_dir, "concat.txt")
+        chapter_files = list_chapter_files()
+        concat_file_path = os.path.join(TMP_DIR, "concat.txt")
+        # list_chapter_files() already returns absolute paths under TMP_DIR.
+        if os.name == 'nt':
+            chapter_files = [file_path.replace("\\", "/") for file_path in chapter_files]
         with open(concat_file_path, "w") as concat_file:
-            for file_path in chapter_files:
-                abs_path = os.path.abspath(file_path)
-                formatted_path = abs_path.replace("\\", "/") if os.name == 'nt' else abs_path
-                concat_file.write(f"file '{formatted_path}'\n")
+            concat_file.write("".join(f"file '{file_path}'\n" for file_path in chapter_files))
 
         concat_command = [
             "ffmpeg",
@@ -98,7 +143,7 @@ def concatenate_chapters():
             "-safe", "0",
             "-i", concat_file_path,
             "-c", "copy",
-            os.path.join(os.getcwd(), "output.mkv")
+            get_abs_path("output.mkv")
         ]
         subprocess.run(concat_command, check=True)
         print("[SUCCESS] Chapters concatenated successfully into 'output.mkv'.")
@@ -106,53 +151,113 @@ def concatenate_chapters():
         print(f"[ERROR] Failed to concatenate chapter files: {e}")
         exit(1)
 
+def get_ffprobe_cache_path(abs_input, command):
+    """Returns the cache file for this input file's current contents and the given ffprobe command."""
+    stat = os.stat(abs_input)
+    key_source = f"{abs_input}:{stat.st_mtime_ns}:{stat.st_size}:{' '.join(command)}"
+    key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+    return os.path.join(FFPROBE_CACHE_DIR, f"{key}.json")
+
+def save_ffprobe_cache(cache_path, output):
+    """Stores raw ffprobe output in the cache; failures only cost the next run a fresh probe."""
+    try:
+        os.makedirs(FFPROBE_CACHE_DIR, exist_ok=True)
+        with open(f"{cache_path}.tmp", 'wb') as f:
+            f.write(output)
+        os.replace(f"{cache_path}.tmp", cache_path)
+    except OSError as e:
+        print(f"[WARNING] Failed to cache ffprobe output: {e}")
+
 def run_ffprobe(input_file):
-    """Runs ffprobe on the input file and returns JSON output."""
+    """Runs ffprobe on the input file and returns JSON output, reusing a cached result when the file is unchanged."""
     try:
-        print(f"[INFO] Running ffprobe for '{input_file}' to extract chapter information...")
         command = [
             "ffprobe",
             "-i", get_abs_path(input_file),
             "-print_format", "json",
             "-show_chapters",
             "-show_format",
+            "-show_streams",
+            "-select_streams", "a",
             "-loglevel", "error"
         ]
-        result = subprocess.run(command, capture_output=True, text=True)
+        cache_path = get_ffprobe_cache_path(get_abs_path(input_file), command)
+        try:
+            with open(cache_path, 'rb') as f:
+                json_output = json.load(f)
+            print(f"[INFO] Using cached chapter information for '{input_file}'.")
+            return json_output
+        except (OSError, ValueError):
+            pass
+
+        print(f"[INFO] Running ffprobe for '{input_file}' to extract chapter information...")
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         if result.returncode != 0:
-            raise Exception(f"ffprobe error: {result.stderr}")
+            raise Exception(f"ffprobe error: {result.stderr.decode(errors='replace')}")
         print("[SUCCESS] Chapter information extracted successfully.")
-        return json.loads(result.stdout)
+        json_output = json.loads(result.stdout)
+        save_ffprobe_cache(cache_path, result.stdout)
+        return json_output
     except Exception as e:
         print(f"[ERROR] Failed to run ffprobe: {e}")
         exit(1)
 
-def generate_ffmpeg_commands(chapters, input_file, svt_av1_params, preset, crf):
+def can_copy_audio(audio_streams):
+    """Returns True if the source audio already matches the opus 5.1 <= 256K target and can be stream copied."""
+    # With several audio tracks ffmpeg's default stream selection may not pick the one probed here.
+    if len(audio_streams) != 1:
+        return False
+    stream = audio_streams[0]
+    # Matroska audio usually has no stream bit_rate; mkvmerge records it in the BPS tag instead.
+    tags = stream.get('tags', {})
+    bit_rate = stream.get('bit_rate') or tags.get('BPS') or tags.get('BPS-eng')
+    if not bit_rate or not str(bit_rate).isdigit():
+        return False
+    return (stream.get('codec_name') == 'opus'
+            and stream.get('channels') == 6
+            and int(bit_rate) <= 256000)
+
+def generate_ffmpeg_commands(chapters, input_file, svt_av1_params, preset, crf, audio_streams):
     """Generates ffmpeg commands for each chapter."""
+    abs_input = get_abs_path(input_file)
+    # Give each job's decoder the same thread budget as its encoder so concurrent jobs don't oversubscribe the CPU.
+    decode_threads = str(get_svt_lp(svt_av1_params))
+    common_opts = (
+        "-c:v", "libsvtav1",
+        "-preset", preset,
+        "-crf", crf,
+        "-g", "360",
+        "-pix_fmt", "yuv420p10le",
+        "-svtav1-params", svt_av1_params,
+    )
+    if can_copy_audio(audio_streams):
+        print("[INFO] Source audio is already opus 5.1 at or below 256K; copying it instead of re-encoding.")
+        common_opts += ("-c:a", "copy")
+    else:
+        common_opts += (
+            "-c:a", "libopus",
+            "-ac",  "6",
+            "-b:a", "256K",
+            "-vbr:a", "2",
+        )
+    common_opts += (
+        "-sn",
+        "-reset_timestamps", "1",
+    )
+
     ffmpeg_commands = []
     for chapter in chapters:
         title = chapter['tags']['title'].replace(" ", "_")
-       
-        tmp_dir = get_abs_path("tmp")
-        output_file = os.path.join(tmp_dir, f"{title}.mkv")
+        output_file = os.path.join(TMP_DIR, f"{title}.mkv")
        
         base_command = [
             "ffmpeg",
+            # Input-side -ss/-to seek via the container index instead of demuxing from the start.
             "-ss", chapter['start_time'],
             "-to", chapter['end_time'],
-            "-i", get_abs_path(input_file),
-            "-c:v", "libsvtav1",
-            "-preset", preset,
-            "-crf", crf,
-            "-g", "360",
-            "-pix_fmt", "yuv420p10le",
-            "-svtav1-params", svt_av1_params,
-            "-c:a", "libopus",
-            "-ac",  "6",
-            "-b:a", "256K",
-            "-vbr:a", "2",
-            "-sn",
-            "-reset_timestamps", "1",
+            "-threads", decode_threads,
+            "-i", abs_input,
+            *common_opts,
             output_file
         ]
        
@@ -161,7 +266,6 @@ def generate_ffmpeg_commands(chapters, input_file, svt_av1_params, preset, crf):
             "length_in_seconds": float(chapter['end_time']) - float(chapter['start_time']),
             "command": base_command
         })
-    print(ffmpeg_commands)
     return ffmpeg_commands
 
 def save_ffjob_info(ffjob_info, input_file, total_length):
@@ -169,80 +273,167 @@ def save_ffjob_info(ffjob_info, input_file, total_length):
     try:
         ffjob_info["total_length_in_seconds"] = total_length
         ffjob_info["executed_datetime"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open("ffjob.json", 'w') as f:
-            json.dump(ffjob_info, f, indent=4)
+        # Write to a temporary file first so -status never sees a half-written job file.
+        with open("ffjob.json.tmp", 'wb') as f:
+            f.write(json.dumps(ffjob_info).encode())
+        os.replace("ffjob.json.tmp", "ffjob.json")
         print("[SUCCESS] Saved job information to ffjob.json")
     except Exception as e:
         print(f"[ERROR] Failed to save job information: {e}")
 
-def execute_ffmpeg_command(chapter_info):
-    """Executes the ffmpeg command in a separate process without waiting for it to complete."""
-    try:
-        title = chapter_info['title']
-        command = chapter_info['command']
+async def execute_ffmpeg_command(chapter_info, semaphore):
+    """Executes the ffmpeg command once a worker slot is free and waits for it to complete."""
+    title = chapter_info['title']
+    async with semaphore:
+        try:
+            command = chapter_info['command']
 
-        log_file_path = os.path.join(get_abs_path("log"), f"{title}.log")
-        with open(log_file_path, 'a') as log_file:
-            subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT)
-        print(f"[INFO] Encoding for '{title}' is running in the background. Log: {log_file_path}")
-    except Exception as e:
-        print(f"[ERROR] Failed to start encoding for '{title}': {e}")
+            log_file_path = os.path.join(LOG_DIR, f"{title}.log")
+            with open(log_file_path, 'a') as log_file:
+                process = await asyncio.create_subprocess_exec(*command, stdout=log_file, stderr=subprocess.STDOUT)
+            print(f"[INFO] Encoding for '{title}' started. Log: {log_file_path}")
+            returncode = await process.wait()
+            if returncode != 0:
+                print(f"[ERROR] Encoding for '{title}' exited with code {returncode}. Log: {log_file_path}")
+            else:
+                print(f"[SUCCESS] Encoding for '{title}' finished.")
+        except Exception as e:
+            print(f"[ERROR] Failed to start encoding for '{title}': {e}")
+
+async def run_encodes(ffmpeg_commands, max_workers):
+    """Runs every chapter encode, keeping at most max_workers ffmpeg processes alive at once."""
+    semaphore = asyncio.Semaphore(max_workers)
+    await asyncio.gather(*(execute_ffmpeg_command(chapter_info, semaphore) for chapter_info in ffmpeg_commands))
 
 def get_ffjob_info():
     """Reads the ffjob information from the JSON file."""
     try:
-        with open("ffjob.json", 'r') as f:
+        with open("ffjob.json", 'rb') as f:
             return json.load(f)
     except Exception as e:
         print(f"[ERROR] Failed to read job information: {e}")
         exit(1)
 
 
+def parse_progress(data):
+    """Returns the fps and time encoded from the last ffmpeg progress line in raw log bytes, or None."""
+    for line in reversed(data.replace(b"\r", b"\n").split(b"\n")):
+        if b"fps=" in line and b"time=" in line:
+            fps = line.split(b"fps=")[1].split()[0]
+            time_encoded = line.split(b"time=")[1].split()[0]
+            # ffmpeg reports time=N/A until the encoder emits its first packet.
+            if not PROGRESS_TIME_RE.fullmatch(time_encoded):
+                continue
+            return fps.decode('ascii', 'ignore'), time_encoded.decode('ascii', 'ignore')
+    return None
+
 def parse_log_file(log_filename):
     """Parses the log file to get the last reported encoding speed and time encoded."""
-    with open(log_filename, 'r') as f:
-        lines = f.readlines()
-    if lines:
-        last_line = lines[-1]
-        fps = last_line.split("fps=")[1].split(" ")[0]
-        time_encoded = last_line.split("time=")[1].split(" ")[0]
-        return fps, time_encoded
+    try:
+        with open(log_filename, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - LOG_TAIL_BYTES))
+            tail = f.read()
+    except FileNotFoundError:
+        # Chapters still waiting in the worker pool have no log yet.
+        return "N/A", "00:00:00.00"
+    # Ignore a progress line ffmpeg is still in the middle of writing.
+    end = max(tail.rfind(b"\r"), tail.rfind(b"\n")) + 1
+    progress = parse_progress(tail[:end])
+    if progress:
+        return progress
     return "N/A", "00:00:00.00"
 
+def time_to_seconds(time_encoded):
+    """Converts an ffmpeg HH:MM:SS.ss timestamp into seconds, treating negative or other values (e.g. N/A) as 0."""
+    # ffmpeg reports slightly negative times such as -00:00:00.02 for the first frames.
+    if time_encoded.startswith("-") or not PROGRESS_TIME_RE.fullmatch(time_encoded.encode()):
+        return 0.0
+    hours, minutes, seconds = time_encoded.split(":", 2)
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
 def format_time_delta(total_seconds):
     """Formats seconds into HH:MM:SS format."""
     return str(timedelta(seconds=int(total_seconds)))
 
 def check_encoding_status(ffjob_info):
     """Checks and prints the status of the current encoding tasks."""
+    out = []
     total_encoded_time_seconds = 0
     for chapter in ffjob_info["chapters"]:
         title = chapter["title"]
         command = chapter["command"]
-        print(f"\nChapter: {title}")
-        print(f"Command: {command}")
+        out.append(f"\nChapter: {title}\n")
+        out.append(f"Command: {command}\n")
        
-        log_filename = os.path.join(get_abs_path("log"), f"{title}.log")
+        log_filename = os.path.join(LOG_DIR, f"{title}.log")
         fps, time_encoded = parse_log_file(log_filename)
-        encoded_time_seconds = sum(x * float(t) for x, t in zip([3600, 60, 1], time_encoded.split(":")))
+        encoded_time_seconds = time_to_seconds(time_encoded)
         total_encoded_time_seconds += encoded_time_seconds
        
-        print(f"Encoding Speed: {fps} fps")
-        print(f"Chapter Length: {format_time_delta(chapter['length_in_seconds'])} (hh:mm:ss)")
-        print(f"Amount Encoded: {time_encoded} (hh:mm:ss)")
-        print(f"Chapter Completion: {encoded_time_seconds / chapter['length_in_seconds'] * 100:.2f}%")
+        out.append(f"Encoding Speed: {fps} fps\n")
+        out.append(f"Chapter Length: {format_time_delta(chapter['length_in_seconds'])} (hh:mm:ss)\n")
+        out.append(f"Amount Encoded: {time_encoded} (hh:mm:ss)\n")
+        out.append(f"Chapter Completion: {encoded_time_seconds / chapter['length_in_seconds'] * 100:.2f}%\n")
    
     total_video_length = ffjob_info["total_length_in_seconds"]
-    print(f"\nTotal Amount Encoded: {format_time_delta(total_encoded_time_seconds)} (hh:mm:ss)")
-    print(f"Total Video Length: {format_time_delta(total_video_length)} (hh:mm:ss)")
-    print(f"Completion: {total_encoded_time_seconds / total_video_length * 100:.2f}%")
+    out.append(f"\nTotal Amount Encoded: {format_time_delta(total_encoded_time_seconds)} (hh:mm:ss)\n")
+    out.append(f"Total Video Length: {format_time_delta(total_video_length)} (hh:mm:ss)\n")
+    out.append(f"Completion: {total_encoded_time_seconds / total_video_length * 100:.2f}%\n")
    
     executed_datetime = datetime.strptime(ffjob_info["executed_datetime"], "%Y-%m-%d %H:%M:%S")
     elapsed_time = datetime.now() - executed_datetime
-    print(f"Current Runtime: {elapsed_time}")
-    print(f"Estimated Time Left: {format_time_delta((total_video_length - total_encoded_time_seconds) / (total_encoded_time_seconds / elapsed_time.total_seconds()))} (hh:mm:ss)")
+    out.append(f"Current Runtime: {elapsed_time}\n")
+    if total_encoded_time_seconds > 0:
+        out.append(f"Estimated Time Left: {format_time_delta((total_video_length - total_encoded_time_seconds) / (total_encoded_time_seconds / elapsed_time.total_seconds()))} (hh:mm:ss)\n")
+    else:
+        out.append("Estimated Time Left: N/A\n")
+    sys.stdout.write("".join(out))
+
+def watch_encoding_status(ffjob_info):
+    """Follows the chapter logs and prints progress, reading only output appended since the last poll."""
+    chapters = ffjob_info["chapters"]
+    total_video_length = ffjob_info["total_length_in_seconds"]
+    log_files = {}
+    pending = {}
+    progress = {chapter["title"]: ("N/A", "00:00:00.00") for chapter in chapters}
+    print(f"[INFO] Watching {len(chapters)} chapter logs. Press Ctrl+C to stop.")
+    try:
+        while True:
+            for chapter in chapters:
+                title = chapter["title"]
+                log_file = log_files.get(title)
+                if log_file is None:
+                    try:
+                        log_file = open(os.path.join(LOG_DIR, f"{title}.log"), 'rb')
+                    except FileNotFoundError:
+                        continue
+                    log_file.seek(0, os.SEEK_END)
+                    log_file.seek(max(0, log_file.tell() - LOG_TAIL_BYTES))
+                    log_files[title] = log_file
+                    pending[title] = b""
+
+                data = pending[title] + log_file.read()
+                # Keep any partially written progress line for the next poll.
+                end = max(data.rfind(b"\r"), data.rfind(b"\n")) + 1
+                pending[title] = data[end:]
+                latest = parse_progress(data[:end])
+                if latest:
+                    progress[title] = latest
+
+            total_encoded_time_seconds = sum(time_to_seconds(time_encoded) for _, time_encoded in progress.values())
+            line = ", ".join(f"{title}: {fps} fps" for title, (fps, _) in progress.items() if fps != "N/A")
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] Completion: {total_encoded_time_seconds / total_video_length * 100:.2f}% "
+                  f"({format_time_delta(total_encoded_time_seconds)} of {format_time_delta(total_video_length)}) {line}")
+            time.sleep(WATCH_INTERVAL_SECONDS)
+    except KeyboardInterrupt:
+        print("\n[INFO] Stopped watching.")
+    finally:
+        for log_file in log_files.values():
+            log_file.close()
 
-def main(input_file, svt_av1_params, preset, crf, status, complete):
+def main(input_file, svt_av1_params, preset, crf, status, complete, watch):
     """Main function to process the input file and generate ffmpeg commands."""
 
     if complete:
@@ -257,6 +448,9 @@ def main(input_file, svt_av1_params, preset, crf, status, complete):
     elif status:
         ffjob_info = get_ffjob_info()
         check_encoding_status(ffjob_info)
+    elif watch:
+        ffjob_info = get_ffjob_info()
+        watch_encoding_status(ffjob_info)
     else:
         print("[INFO] Script started. Preparing to process video file...")
         ensure_directories_exist(input_file)
@@ -265,25 +459,26 @@ def main(input_file, svt_av1_params, preset, crf, status, complete):
         total_length = float(json_output['format']['duration'])
    
         print(f"[INFO] Found {len(chapters)} chapters. Generating ffmpeg commands...")
-        ffmpeg_commands = generate_ffmpeg_commands(chapters, input_file, svt_av1_params, preset, crf)
+        ffmpeg_commands = generate_ffmpeg_commands(chapters, input_file, svt_av1_params, preset, crf, json_output.get('streams', []))
         ffjob_info = {"chapters": ffmpeg_commands}
+        save_ffjob_info(ffjob_info, input_file, total_length)
 
-        for chapter_info in ffmpeg_commands:
-            title = chapter_info["title"]
-            print(f"Generated command for {title} encoding")
-            execute_ffmpeg_command(chapter_info)
+        max_workers = get_encode_workers(svt_av1_params)
+        print(f"[INFO] Encoding {len(ffmpeg_commands)} chapters, up to {max_workers} at a time...")
+        print("[INFO] Keep this command running until all chapters finish (e.g. under nohup or tmux); use -status or -watch from another shell to check progress.")
+        asyncio.run(run_encodes(ffmpeg_commands, max_workers))
 
-        save_ffjob_info(ffjob_info, input_file, total_length)
-        print("All ffmpeg commands have been generated and dispatched for encoding.")
+        print("All chapter encodes have finished.")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Process video file or check encoding status.")
     parser.add_argument("input_file", nargs='?', default=None, help="The input video file to process.")
     parser.add_argument("--svt_av1_params", default=" tune=0:enable-overlays=1:scm=0:scd=1:lookahead=120:keyint=360:film-grain=3:input-depth=10:irefresh-type=1:lp=4", help="SVT-AV1 specific parameters as a string.")
-    parser.add_argument("--preset", default="1", help="Encoding preset.")
+    parser.add_argument("--preset", default="6", help="SVT-AV1 encoding preset (lower is slower and more efficient).")
     parser.add_argument("--crf", default="16", help="Constant Rate Factor for encoding quality.")
     parser.add_argument("-status", action="store_true", help="Check the status of the current encoding tasks.")
+    parser.add_argument("-watch", action="store_true", help="Continuously follow the encoding progress until interrupted.")
     parser.add_argument("-complete", action="store_true", help="Complete the encoding process by concatenating chapters and cleaning up.")
     args = parser.parse_args()
 
-    main(args.input_file, args.svt_av1_params, args.preset, args.crf, args.status, args.complete)
\ No newline at end of file
+    main(args.input_file, args.svt_av1_params, args.preset, args.crf, args.status, args.complete, args.watch)
\ No newline at end of file